@@ -11,25 +11,341 @@ Usage:
 Dependencies:
     - moviepy: For video processing
     - speech_recognition: For audio transcription
-    - pydub: For audio processing
-    - whisper: For advanced speech recognition (optional but recommended)
+    - numpy: For audio processing
+    - faster-whisper: For advanced speech recognition (optional but recommended)
 """
 
 import argparse
+import concurrent.futures
+import functools
+import gc
 import os
+import subprocess
 import sys
 import tempfile
+import threading
 from pathlib import Path
+import numpy as np
 import speech_recognition as sr
-from moviepy.editor import VideoFileClip, TextClip, CompositeVideoClip
+import webrtcvad
+from moviepy.editor import VideoFileClip, ImageClip
 from moviepy.config import check_for_optional_components
-from pydub import AudioSegment
-from pydub.silence import split_on_silence
-import whisper
+from PIL import Image, ImageDraw, ImageFont
+import ctranslate2
+from faster_whisper import WhisperModel, BatchedInferencePipeline
+
+
+MODEL_SIZES = ["tiny", "base", "small", "medium", "large"]
+
+# Full-scale amplitude of 16-bit PCM (pydub's max_possible_amplitude)
+INT16_MAX_AMPLITUDE = 32768.0
+
+# Whisper's native input sample rate
+SAMPLE_RATE = 16000
+
+# VAD chunking: a chunk closes once it is at least VAD_MIN_CHUNK_S long and
+# ends in VAD_TAIL_SILENCE_MS of silence, or when it reaches Whisper's 30 s window
+VAD_AGGRESSIVENESS = 2
+VAD_FRAME_MS = 30
+VAD_MIN_CHUNK_S = 5
+VAD_MAX_CHUNK_S = 30
+VAD_TAIL_SILENCE_MS = 100
+
+# Concurrent Google Speech Recognition requests in the fallback path
+RECOGNIZE_WORKERS = 16
+
+
+def _vad_chunks(pcm, sample_rate=SAMPLE_RATE):
+    """
+    Cut audio into speech chunks of at most VAD_MAX_CHUNK_S at silence boundaries.
+    
+    Uses WebRTC VAD over VAD_FRAME_MS frames. Leading and trailing silence of
+    each chunk is dropped, so stretches of silence are never decoded.
+    
+    Args:
+        pcm (numpy.ndarray): Mono int16 PCM samples
+        sample_rate (int): Sample rate of pcm
+        
+    Returns:
+        list: List of (start, end) sample offsets
+    """
+    vad = webrtcvad.Vad(VAD_AGGRESSIVENESS)
+    frame_len = sample_rate * VAD_FRAME_MS // 1000
+    min_frames = VAD_MIN_CHUNK_S * 1000 // VAD_FRAME_MS
+    max_frames = VAD_MAX_CHUNK_S * 1000 // VAD_FRAME_MS
+    tail_frames = -(-VAD_TAIL_SILENCE_MS // VAD_FRAME_MS)
+    
+    chunks = []
+    chunk_start = None
+    silent_run = 0
+    for i in range(len(pcm) // frame_len):
+        frame = pcm[i * frame_len:(i + 1) * frame_len].tobytes()
+        is_speech = vad.is_speech(frame, sample_rate)
+        
+        if chunk_start is None:
+            if is_speech:
+                chunk_start, silent_run = i, 0
+            continue
+        
+        silent_run = 0 if is_speech else silent_run + 1
+        length = i + 1 - chunk_start
+        if length >= max_frames:
+            chunks.append((chunk_start * frame_len, (i + 1) * frame_len))
+            chunk_start = None
+        elif length >= min_frames and silent_run >= tail_frames:
+            chunks.append((chunk_start * frame_len, (i + 1 - silent_run) * frame_len))
+            chunk_start = None
+    
+    if chunk_start is not None:
+        chunk_end = len(pcm) // frame_len - silent_run
+        chunks.append((chunk_start * frame_len, chunk_end * frame_len))
+    
+    return chunks
+
+
+def _dbfs(pcm):
+    """Loudness of int16 PCM in dBFS (as pydub's AudioSegment.dBFS)."""
+    rms = np.sqrt(np.mean(np.square(pcm, dtype=np.float64))) if len(pcm) else 0.0
+    if not rms:
+        return -np.inf
+    return 20 * np.log10(rms / INT16_MAX_AMPLITUDE)
+
+
+def _fast_split_on_silence(pcm, min_silence_len=1000, silence_thresh=-16, keep_silence=100,
+                           sample_rate=SAMPLE_RATE):
+    """
+    Vectorized equivalent of pydub's split_on_silence (with seek_step=1).
+    
+    pydub computes the RMS of every 1 ms-stepped window in Python; here a
+    cumulative sum of squares gives each window's RMS in O(1), so the whole
+    detection is a single NumPy pass. Works on the PCM array directly and
+    returns offsets, so no chunk audio is copied.
+    
+    Args:
+        pcm (numpy.ndarray): Mono int16 PCM samples
+        min_silence_len (int): Minimum silence length in ms
+        silence_thresh (float): Silence threshold in dBFS
+        keep_silence (int): Silence in ms to keep around each chunk
+        sample_rate (int): Sample rate of pcm
+        
+    Returns:
+        list: List of (start, end) sample offsets of non-silent chunks
+    """
+    samples_per_ms = sample_rate / 1000.0
+    audio_len = int(len(pcm) / samples_per_ms)  # in ms, as len(AudioSegment)
+    if audio_len < min_silence_len:
+        return [(0, len(pcm))]
+    
+    samples = pcm.astype(np.float64)
+    csq = np.concatenate([[0.0], np.cumsum(samples * samples)])
+    
+    # RMS of the window starting at every millisecond
+    window = int(min_silence_len * samples_per_ms)
+    starts = (np.arange(audio_len - min_silence_len + 1) * samples_per_ms).astype(np.int64)
+    rms = np.sqrt((csq[starts + window] - csq[starts]) / max(window, 1))
+    
+    thresh = 10 ** (silence_thresh / 20.0) * INT16_MAX_AMPLITUDE
+    silent_starts = np.flatnonzero(rms <= thresh)
+    
+    # Run-length encode consecutive silent windows into silence ranges
+    if len(silent_starts):
+        breaks = np.flatnonzero(np.diff(silent_starts) > 1)
+        range_starts = silent_starts[np.concatenate([[0], breaks + 1])]
+        range_ends = silent_starts[np.concatenate([breaks, [len(silent_starts) - 1]])]
+        range_ends = range_ends + min_silence_len
+    else:
+        range_starts = range_ends = np.array([], dtype=np.int64)
+    
+    # Non-silent ranges are the gaps between silences
+    bounds = np.concatenate([[0], range_ends, [audio_len]]), np.concatenate([range_starts, [audio_len]])
+    output_ranges = [
+        [int(start) - keep_silence, int(end) + keep_silence]
+        for start, end in zip(*bounds)
+        if end > start
+    ]
+    
+    # Split overlapping padding evenly between neighbours, as pydub does
+    for range_i, range_ii in zip(output_ranges, output_ranges[1:]):
+        if range_ii[0] < range_i[1]:
+            range_i[1] = (range_i[1] + range_ii[0]) // 2
+            range_ii[0] = range_i[1]
+    
+    return [
+        (int(max(start, 0) * samples_per_ms), int(min(end, audio_len) * samples_per_ms))
+        for start, end in output_ranges
+    ]
+
+
+# libass style for burned-in captions: white Arial Bold, black outline, bottom center
+SUBTITLE_STYLE = (
+    "FontName=Arial,Bold=1,Fontsize=24,PrimaryColour=&Hffffff&,"
+    "OutlineColour=&H000000&,Outline=2,Alignment=2"
+)
+
+# Soft subtitle codec per output container (mov_text for MP4/MOV). WebM is
+# not listed: it can't hold the H.264 streams that --soft-subs copies.
+SUBTITLE_CODECS = {".mkv": "srt"}
+
+# Caption styling for the MoviePy fallback renderer
+CAPTION_FONT_SIZE = 50
+CAPTION_FONTS = ["Arial-Bold.ttf", "Arial Bold.ttf", "arialbd.ttf", "DejaVuSans-Bold.ttf"]
+CAPTION_STROKE_WIDTH = 2
+
+
+@functools.lru_cache(maxsize=8)
+def _load_caption_font(size):
+    """Load the first available caption font, falling back to PIL's default."""
+    for font_name in CAPTION_FONTS:
+        try:
+            return ImageFont.truetype(font_name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size)
+
+
+@functools.lru_cache(maxsize=2048)
+def _render_caption(text, size, max_width):
+    """
+    Render caption text to an RGBA array: white text with a black outline,
+    word-wrapped to max_width and centered. Cached since captions repeat.
+    
+    Args:
+        text (str): Caption text
+        size (int): Font size in pixels
+        max_width (int): Maximum line width in pixels
+        
+    Returns:
+        numpy.ndarray: RGBA image of shape (height, width, 4)
+    """
+    font = _load_caption_font(size)
+    
+    # Greedy word wrap
+    lines = []
+    for word in text.split():
+        candidate = f"{lines[-1]} {word}" if lines else word
+        if lines and font.getlength(candidate) <= max_width:
+            lines[-1] = candidate
+        else:
+            lines.append(word)
+    wrapped = "\n".join(lines)
+    
+    # Measure, then draw text with a stroke pass onto a transparent canvas
+    measure = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+    left, top, right, bottom = (int(round(v)) for v in measure.multiline_textbbox(
+        (0, 0), wrapped, font=font, align="center", stroke_width=CAPTION_STROKE_WIDTH
+    ))
+    image = Image.new("RGBA", (max(right - left, 1), max(bottom - top, 1)), (0, 0, 0, 0))
+    ImageDraw.Draw(image).multiline_text(
+        (-left, -top),
+        wrapped,
+        font=font,
+        fill="white",
+        align="center",
+        stroke_width=CAPTION_STROKE_WIDTH,
+        stroke_fill="black"
+    )
+    
+    return np.array(image)
+
+
+# H.264 encoders as (codec, preset, extra ffmpeg params), best first
+H264_ENCODERS = [
+    ("h264_nvenc", "p4", ["-rc", "vbr", "-cq", "23", "-b:v", "0"]),
+    ("libx264", "veryfast", ["-crf", "23"]),
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _h264_encoder():
+    """
+    Pick the H.264 encoder for the output video, probed once per process.
+    
+    NVENC is used when ffmpeg was built with it and a test encode succeeds
+    (the encoder can be listed on machines without an NVIDIA GPU).
+    
+    Returns:
+        tuple: (codec, preset, extra ffmpeg params)
+    """
+    try:
+        encoders = subprocess.run(
+            ["ffmpeg", "-nostdin", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True
+        ).stdout
+    except OSError:
+        encoders = ""
+    
+    for codec, preset, codec_params in H264_ENCODERS[:-1]:
+        if codec not in encoders:
+            continue
+        probe = subprocess.run(
+            ["ffmpeg", "-nostdin", "-hide_banner",
+             "-f", "lavfi", "-i", "color=size=256x256:duration=0.1",
+             "-c:v", codec, "-preset", preset, "-f", "null", "-"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        if probe.returncode == 0:
+            return codec, preset, codec_params
+    
+    return H264_ENCODERS[-1]
+
+
+@functools.lru_cache(maxsize=1)
+def _has_subtitles_filter():
+    """Check once per process whether ffmpeg has the libass subtitles filter."""
+    try:
+        filters = subprocess.run(
+            ["ffmpeg", "-nostdin", "-hide_banner", "-filters"],
+            capture_output=True,
+            text=True
+        ).stdout
+    except OSError:
+        return False
+    return any(line.split()[1:2] == ["subtitles"] for line in filters.splitlines())
+
+
+def _ffmpeg_stderr_tail(error, lines=10):
+    """Return the last lines of a failed ffmpeg run's captured stderr."""
+    stderr = error.stderr or b""
+    if isinstance(stderr, bytes):
+        stderr = stderr.decode(errors="replace")
+    return "\n".join(stderr.strip().splitlines()[-lines:]) or str(error)
+
+
+def _format_srt_time(seconds):
+    """Format seconds as an SRT timestamp (HH:MM:SS,mmm)."""
+    millis = int(round(seconds * 1000))
+    hours, millis = divmod(millis, 3600000)
+    minutes, millis = divmod(millis, 60000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
+
+def _escape_filter_path(path):
+    """
+    Escape a file path for use as an ffmpeg filter option value in -vf.
+    
+    Two levels apply: the filter's option parser splits on ':' (so a drive
+    letter like C: must be escaped), and the filtergraph parser strips one
+    level of escaping before that, so the option-escaped value is wrapped in
+    single quotes to reach the filter intact.
+    """
+    # Option level: backslash-escape \, ' and :
+    for char in ("\\", "'", ":"):
+        path = path.replace(char, "\\" + char)
+    # Graph level: quote, ending the quote around each literal '
+    return "'" + path.replace("'", "'\\''") + "'"
 
 
 class VideoCaptionGenerator:
-    def __init__(self, video_path, output_path, model_size="base"):
+    # Loaded models shared across instances, with the number of holders of each
+    _models = {}
+    _model_refs = {}
+    _models_lock = threading.Lock()
+
+    def __init__(self, video_path, output_path, model_size="base", batch_size=16, soft_subs=False,
+                 keep_model_loaded=False):
         """
         Initialize the video caption generator.
         
@@ -37,119 +353,246 @@ class VideoCaptionGenerator:
             video_path (str): Path to input video file
             output_path (str): Path for output video file
             model_size (str): Whisper model size ("tiny", "base", "small", "medium", "large")
+                or path to a CTranslate2-converted model directory
+            batch_size (int): Number of audio chunks decoded in parallel by Whisper
+            soft_subs (bool): Mux captions as a subtitle track instead of burning them in
+            keep_model_loaded (bool): Keep the Whisper model cached after transcription
+                so later instances in the same process reuse it, instead of freeing
+                it before the video encode
         """
         self.video_path = video_path
         self.output_path = output_path
         self.model_size = model_size
+        self.batch_size = batch_size
+        self.soft_subs = soft_subs
+        self.keep_model_loaded = keep_model_loaded
         self.temp_dir = tempfile.mkdtemp()
         
-        # Load Whisper model
-        print(f"Loading Whisper model ({model_size})...")
-        self.whisper_model = whisper.load_model(model_size)
+        self.device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        
+        # Whisper model is loaded lazily so it can overlap audio extraction
+        self.whisper_model = None
+        self.whisper_pipeline = None
         
+    def load_whisper_model(self):
+        """Load the Whisper model (shared across instances) and its batched pipeline."""
+        if self.whisper_model is not None:
+            return
+        self.whisper_model = VideoCaptionGenerator._get_model(self.model_size, self.device)
+        self.whisper_pipeline = BatchedInferencePipeline(model=self.whisper_model)
+        
+    def release_whisper_model(self):
+        """
+        Drop this instance's reference to the Whisper model.
+        
+        Unless keep_model_loaded is set, the shared model is freed (RAM/VRAM)
+        once no instance holds it, so it isn't kept alive through the video
+        encode. Sequential callers that set keep_model_loaded load it only once.
+        """
+        if self.whisper_model is None:
+            return
+        self.whisper_model = None
+        self.whisper_pipeline = None
+        VideoCaptionGenerator._release_model(
+            self.model_size, self.device, unload=not self.keep_model_loaded
+        )
+        if not self.keep_model_loaded:
+            gc.collect()
+        
+    @classmethod
+    def _get_model(cls, model_size, device):
+        """
+        Load a Whisper model once per (model_size, device) while it is in use.
+        
+        INT8 weights cut memory traffic ~4x; activations stay FP16 on GPU.
+        Every call must be paired with a _release_model call.
+        
+        Args:
+            model_size (str): Whisper model size or converted model directory
+            device (str): "cuda" or "cpu"
+            
+        Returns:
+            WhisperModel: Loaded model
+        """
+        key = (model_size, device)
+        with cls._models_lock:
+            if key not in cls._models:
+                compute_type = "int8_float16" if device == "cuda" else "int8"
+                print(f"Loading Whisper model ({model_size}) on {device}...")
+                model = WhisperModel(model_size, device=device, compute_type=compute_type)
+                if device == "cuda":
+                    # Warm up: the first GPU pass pays CUDA context and kernel
+                    # setup, so do it here (overlapping audio extraction)
+                    # rather than on the first real batch
+                    segments, _ = model.transcribe(
+                        np.zeros(SAMPLE_RATE, dtype=np.float32), language="en", beam_size=1
+                    )
+                    list(segments)
+                cls._models[key] = model
+            cls._model_refs[key] = cls._model_refs.get(key, 0) + 1
+            return cls._models[key]
+    
+    @classmethod
+    def _release_model(cls, model_size, device, unload=True):
+        """
+        Release one reference to a model from _get_model.
+        
+        Args:
+            model_size (str): Whisper model size or converted model directory
+            device (str): "cuda" or "cpu"
+            unload (bool): Unload the model if no references remain; otherwise
+                keep it cached for later _get_model calls
+        """
+        key = (model_size, device)
+        with cls._models_lock:
+            cls._model_refs[key] -= 1
+            if not cls._model_refs[key] and unload:
+                del cls._model_refs[key]
+                del cls._models[key]
+    
     def extract_audio(self):
-        """Extract audio from video file."""
+        """
+        Extract audio from video file.
+        
+        Returns:
+            numpy.ndarray: 16 kHz mono int16 PCM samples
+        """
         print("Extracting audio from video...")
         
-        # Load video and extract audio
-        video = VideoFileClip(self.video_path)
-        audio_path = os.path.join(self.temp_dir, "audio.wav")
-        video.audio.write_audiofile(audio_path, verbose=False, logger=None)
-        video.close()
+        # Decode the audio stream with ffmpeg directly as 16 kHz mono,
+        # the format Whisper expects, and read the raw PCM from stdout
+        # without opening the video stream or touching the disk
+        proc = subprocess.run(
+            ["ffmpeg", "-nostdin", "-i", self.video_path,
+             "-vn", "-ac", "1", "-ar", str(SAMPLE_RATE), "-f", "s16le", "-"],
+            check=True,
+            capture_output=True
+        )
         
-        return audio_path
+        return np.frombuffer(proc.stdout, dtype=np.int16)
     
-    def transcribe_audio_whisper(self, audio_path):
+    def transcribe_audio_whisper(self, pcm):
         """
         Transcribe audio using OpenAI Whisper for better accuracy.
         
         Args:
-            audio_path (str): Path to audio file
+            pcm (numpy.ndarray): 16 kHz mono int16 PCM samples
             
         Returns:
             list: List of subtitle segments with timing and text
         """
         print("Transcribing audio with Whisper...")
         
-        # Transcribe with Whisper
-        result = self.whisper_model.transcribe(audio_path)
+        if self.whisper_pipeline is None:
+            self.load_whisper_model()
+        
+        # Cut the audio into <=30 s speech chunks at silence boundaries
+        chunks = _vad_chunks(pcm)
+        if not chunks:
+            return []
+        
+        # Transcribe with Whisper; the chunks decode as a batch and segment
+        # timestamps come back offset by their chunk's start. Timestamp tokens
+        # split each chunk into sentence-level segments. Greedy decoding
+        # (no beam search, no temperature-fallback candidates) keeps each
+        # chunk to a single decode pass.
+        segments, _ = self.whisper_pipeline.transcribe(
+            pcm.astype(np.float32) / 32768.0,
+            batch_size=self.batch_size,
+            beam_size=1,
+            best_of=1,
+            vad_filter=False,
+            clip_timestamps=[{"start": start, "end": end} for start, end in chunks],
+            without_timestamps=False
+        )
         
-        # Extract segments with timing
+        # Extract segments with timing (segments is a lazy generator)
         subtitles = []
-        for segment in result["segments"]:
+        for segment in segments:
             subtitle = {
-                "start": segment["start"],
-                "end": segment["end"],
-                "text": segment["text"].strip()
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text.strip()
             }
             subtitles.append(subtitle)
             
         return subtitles
     
-    def transcribe_audio_speechrecognition(self, audio_path):
+    def transcribe_audio_speechrecognition(self, pcm):
         """
         Fallback transcription using speech_recognition library.
         Less accurate but doesn't require internet for some engines.
         
         Args:
-            audio_path (str): Path to audio file
+            pcm (numpy.ndarray): 16 kHz mono int16 PCM samples
             
         Returns:
             list: List of subtitle segments with timing and text
         """
         print("Transcribing audio with speech_recognition...")
         
-        # Load audio
-        audio = AudioSegment.from_wav(audio_path)
-        
-        # Split audio on silence
-        chunks = split_on_silence(
-            audio,
+        # Split audio on silence (offsets into pcm, no copies)
+        chunks = _fast_split_on_silence(
+            pcm,
             min_silence_len=500,  # 500ms of silence
-            silence_thresh=audio.dBFS - 14,
+            silence_thresh=_dbfs(pcm) - 14,
             keep_silence=500
         )
         
-        # Initialize recognizer
-        recognizer = sr.Recognizer()
-        subtitles = []
+        # Calculate timing for every chunk up front
+        chunks_with_timing = []
         current_time = 0
+        for start, end in chunks:
+            chunk = pcm[start:end]  # a view, not a copy
+            chunk_duration = len(chunk) / SAMPLE_RATE
+            chunks_with_timing.append((chunk, current_time, current_time + chunk_duration))
+            current_time += chunk_duration
+        
+        # Recognize chunks concurrently; each call is a blocking HTTP request.
+        # One recognizer is shared since recognize_google keeps no per-call state.
+        recognizer = sr.Recognizer()
+        recognize = functools.partial(self._recognize_one, recognizer)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=RECOGNIZE_WORKERS) as executor:
+            results = list(executor.map(recognize, chunks_with_timing))
         
-        for i, chunk in enumerate(chunks):
-            # Export chunk to temporary file
-            chunk_path = os.path.join(self.temp_dir, f"chunk_{i}.wav")
-            chunk.export(chunk_path, format="wav")
+        return [subtitle for subtitle in results if subtitle is not None]
+    
+    def _recognize_one(self, recognizer, chunk_with_timing):
+        """
+        Recognize speech in a single audio chunk with Google Speech Recognition.
+        
+        Args:
+            recognizer (sr.Recognizer): Shared recognizer instance
+            chunk_with_timing (tuple): (int16 PCM chunk, start time, end time)
             
-            # Calculate timing
-            chunk_duration = len(chunk) / 1000.0  # Convert to seconds
-            start_time = current_time
-            end_time = current_time + chunk_duration
+        Returns:
+            dict: Subtitle segment, or None if nothing was recognized
+        """
+        chunk, start_time, end_time = chunk_with_timing
+        
+        try:
+            # Recognize speech in chunk straight from its in-memory PCM
+            audio_data = sr.AudioData(
+                chunk.tobytes(),
+                sample_rate=SAMPLE_RATE,
+                sample_width=chunk.itemsize
+            )
+            text = recognizer.recognize_google(audio_data)
             
-            try:
-                # Recognize speech in chunk
-                with sr.AudioFile(chunk_path) as source:
-                    audio_data = recognizer.record(source)
-                    text = recognizer.recognize_google(audio_data)
-                    
-                    if text.strip():
-                        subtitles.append({
-                            "start": start_time,
-                            "end": end_time,
-                            "text": text.strip()
-                        })
-                        
-            except sr.UnknownValueError:
-                # Could not understand audio
-                pass
-            except sr.RequestError as e:
-                print(f"Could not request results; {e}")
+            if text.strip():
+                return {
+                    "start": start_time,
+                    "end": end_time,
+                    "text": text.strip()
+                }
                 
-            current_time = end_time
+        except sr.UnknownValueError:
+            # Could not understand audio
+            pass
+        except sr.RequestError as e:
+            print(f"Could not request results; {e}")
             
-            # Clean up chunk file
-            os.remove(chunk_path)
-            
-        return subtitles
+        return None
     
     def create_subtitle_clips(self, video, subtitles):
         """
@@ -160,44 +603,168 @@ class VideoCaptionGenerator:
             subtitles (list): List of subtitle segments
             
         Returns:
-            list: List of TextClip objects
+            list: List of ImageClip objects
         """
         print("Creating subtitle clips...")
         
         subtitle_clips = []
+        max_width = int(video.w * 0.8)  # 80% of video width
         
         for subtitle in subtitles:
-            # Create text clip
-            txt_clip = TextClip(
-                subtitle["text"],
-                fontsize=50,
-                color='white',
-                stroke_color='black',
-                stroke_width=2,
-                method='caption',
-                size=(video.w * 0.8, None),  # 80% of video width
-                font='Arial-Bold'
-            ).set_position(('center', video.h * 0.85)).set_duration(
+            # Rasterize once per distinct caption (cached), no ImageMagick call
+            caption = _render_caption(subtitle["text"], CAPTION_FONT_SIZE, max_width)
+            img_clip = ImageClip(caption, ismask=False).set_start(
+                subtitle["start"]
+            ).set_duration(
                 subtitle["end"] - subtitle["start"]
-            ).set_start(subtitle["start"])
+            ).set_position(('center', int(video.h * 0.85)))
             
-            subtitle_clips.append(txt_clip)
+            subtitle_clips.append(img_clip)
             
         return subtitle_clips
     
+    def _write_srt(self, subtitles, srt_path):
+        """
+        Write subtitle segments to an SRT file.
+        
+        Args:
+            subtitles (list): List of subtitle segments
+            srt_path (str): Path for the SRT file
+        """
+        with open(srt_path, "w", encoding="utf-8") as f:
+            for i, subtitle in enumerate(subtitles, start=1):
+                start = _format_srt_time(subtitle["start"])
+                end = _format_srt_time(subtitle["end"])
+                f.write(f"{i}\n{start} --> {end}\n{subtitle['text']}\n\n")
+    
+    def burn_subtitles(self, srt_path):
+        """
+        Burn subtitles into the video in a single ffmpeg pass.
+        
+        libass renders the captions inside ffmpeg's filter graph and the
+        audio stream is copied instead of re-encoded.
+        
+        Args:
+            srt_path (str): Path to the SRT file
+        """
+        print("Burning subtitles with ffmpeg...")
+        
+        codec, preset, codec_params = _h264_encoder()
+        subtitles_filter = f"subtitles={_escape_filter_path(srt_path)}:force_style='{SUBTITLE_STYLE}'"
+        subprocess.run(
+            ["ffmpeg", "-nostdin", "-y", "-loglevel", "error", "-i", self.video_path,
+             "-vf", subtitles_filter,
+             "-c:v", codec, "-preset", preset, *codec_params,
+             "-pix_fmt", "yuv420p",
+             "-c:a", "copy",
+             self.output_path],
+            check=True,
+            capture_output=True
+        )
+    
+    def mux_subtitles(self, srt_path):
+        """
+        Add subtitles as a soft subtitle track, stream-copying video and audio.
+        
+        Nothing is re-encoded, so this is bound by disk I/O rather than encoding.
+        
+        Args:
+            srt_path (str): Path to the SRT file
+        """
+        print("Muxing subtitle track with ffmpeg...")
+        
+        extension = os.path.splitext(self.output_path)[1].lower()
+        subtitle_codec = SUBTITLE_CODECS.get(extension, "mov_text")
+        subprocess.run(
+            ["ffmpeg", "-nostdin", "-y", "-loglevel", "error",
+             "-i", self.video_path, "-i", srt_path,
+             "-map", "0:v", "-map", "0:a?", "-map", "1:s",
+             "-c", "copy", "-c:s", subtitle_codec,
+             self.output_path],
+            check=True,
+            capture_output=True
+        )
+    
+    def composite_subtitles(self, subtitles):
+        """
+        Render subtitles onto the video with MoviePy.
+        
+        Slower than burn_subtitles; used when ffmpeg can't render subtitles.
+        
+        Args:
+            subtitles (list): List of subtitle segments
+        """
+        # Load video: the only time the video stream is opened in a run
+        # (audio was extracted by ffmpeg with -vn)
+        print("Processing video...")
+        video = VideoFileClip(self.video_path)
+        
+        try:
+            # Create subtitle clips in start order
+            subtitles = sorted(subtitles, key=lambda subtitle: subtitle["start"])
+            subtitle_clips = self.create_subtitle_clips(video, subtitles)
+            
+            # Timeline index: the caption active at each frame (-1 for none).
+            # Later-starting captions overwrite earlier ones where they overlap.
+            fps = video.fps
+            active = np.full(int(round(video.duration * fps)) + 1, -1, dtype=np.int32)
+            for i, clip in enumerate(subtitle_clips):
+                active[int(round(clip.start * fps)):int(round(clip.end * fps))] = i
+            
+            def overlay_subtitle(get_frame, t):
+                # Blit only the caption active at t, looked up in O(1),
+                # instead of CompositeVideoClip visiting every clip per frame.
+                # Frames with no caption (including silences) pass through.
+                frame = get_frame(t)
+                index = int(round(t * fps))
+                i = active[index] if index < len(active) else -1
+                if i < 0:
+                    return frame
+                return subtitle_clips[i].blit_on(frame, t)
+            
+            final_video = video.fl(overlay_subtitle)
+            
+            # Write final video. MoviePy only forces yuv420p for libx264;
+            # without it other encoders (NVENC) encode its rgb24 frames as
+            # High 4:4:4, which many browsers and phones can't play.
+            codec, preset, codec_params = _h264_encoder()
+            if codec != 'libx264':
+                codec_params = codec_params + ['-pix_fmt', 'yuv420p']
+            final_video.write_videofile(
+                self.output_path,
+                codec=codec,
+                audio_codec='aac',
+                preset=preset,
+                threads=os.cpu_count(),
+                ffmpeg_params=codec_params,
+                verbose=False,
+                logger=None
+            )
+        finally:
+            # final_video shares video's readers, so this closes both
+            video.close()
+    
     def generate_captioned_video(self):
         """Generate the final video with captions."""
         try:
-            # Extract audio
-            audio_path = self.extract_audio()
+            # Extract audio while the Whisper model loads; the two stages
+            # share no state (ffmpeg subprocess vs. model weights)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                model_future = executor.submit(self.load_whisper_model)
+                audio_future = executor.submit(self.extract_audio)
+                pcm = audio_future.result()
+                
+                # Transcribe audio (try Whisper first, fallback to speech_recognition)
+                try:
+                    model_future.result()
+                    subtitles = self.transcribe_audio_whisper(pcm)
+                except Exception as e:
+                    print(f"Whisper transcription failed: {e}")
+                    print("Falling back to speech_recognition...")
+                    subtitles = self.transcribe_audio_speechrecognition(pcm)
             
-            # Transcribe audio (try Whisper first, fallback to speech_recognition)
-            try:
-                subtitles = self.transcribe_audio_whisper(audio_path)
-            except Exception as e:
-                print(f"Whisper transcription failed: {e}")
-                print("Falling back to speech_recognition...")
-                subtitles = self.transcribe_audio_speechrecognition(audio_path)
+            # Free the model before the encode stage
+            self.release_whisper_model()
             
             if not subtitles:
                 print("No speech detected in the video.")
@@ -205,29 +772,32 @@ class VideoCaptionGenerator:
                 
             print(f"Generated {len(subtitles)} subtitle segments")
             
-            # Load video
-            print("Processing video...")
-            video = VideoFileClip(self.video_path)
-            
-            # Create subtitle clips
-            subtitle_clips = self.create_subtitle_clips(video, subtitles)
-            
-            # Composite video with subtitles
-            final_video = CompositeVideoClip([video] + subtitle_clips)
+            # Write subtitles as SRT and burn them in with ffmpeg (libass)
+            srt_path = os.path.join(self.temp_dir, "captions.srt")
+            self._write_srt(subtitles, srt_path)
             
-            # Write final video
             print(f"Writing output video to {self.output_path}...")
-            final_video.write_videofile(
-                self.output_path,
-                codec='libx264',
-                audio_codec='aac',
-                verbose=False,
-                logger=None
-            )
+            if self.soft_subs:
+                try:
+                    self.mux_subtitles(srt_path)
+                except subprocess.CalledProcessError as e:
+                    raise RuntimeError(
+                        f"ffmpeg subtitle muxing failed:\n{_ffmpeg_stderr_tail(e)}"
+                    ) from e
+                print(f"✅ Successfully created captioned video: {self.output_path}")
+                return True
             
-            # Clean up
-            video.close()
-            final_video.close()
+            if _has_subtitles_filter():
+                try:
+                    self.burn_subtitles(srt_path)
+                except subprocess.CalledProcessError as e:
+                    raise RuntimeError(
+                        f"ffmpeg subtitle burn-in failed:\n{_ffmpeg_stderr_tail(e)}"
+                    ) from e
+            else:
+                print("ffmpeg has no subtitles filter (built without libass)")
+                print("Falling back to MoviePy compositing...")
+                self.composite_subtitles(subtitles)
             
             print(f"✅ Successfully created captioned video: {self.output_path}")
             return True
@@ -237,6 +807,8 @@ class VideoCaptionGenerator:
             return False
         
         finally:
+            self.release_whisper_model()
+            
             # Clean up temporary files
             import shutil
             if os.path.exists(self.temp_dir):
@@ -258,13 +830,38 @@ def main():
     )
     parser.add_argument(
         "--model",
-        choices=["tiny", "base", "small", "medium", "large"],
         default="base",
-        help="Whisper model size (default: base)"
+        help="Whisper model size (tiny, base, small, medium, large) or path to "
+             "a CTranslate2-converted model directory (default: base)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=16,
+        help="Number of audio chunks Whisper decodes in parallel (default: 16)"
+    )
+    parser.add_argument(
+        "--soft-subs",
+        action="store_true",
+        help="Add captions as a selectable subtitle track instead of burning them "
+             "into the picture (no re-encoding, much faster)"
     )
     
     args = parser.parse_args()
     
+    # Validate model
+    if args.model not in MODEL_SIZES and not os.path.isdir(args.model):
+        parser.error(
+            f"--model must be one of {', '.join(MODEL_SIZES)} or an existing model directory"
+        )
+    
+    # Validate soft subtitle container
+    if args.soft_subs and args.output_video.lower().endswith(".webm"):
+        parser.error(
+            "--soft-subs copies the input streams, which WebM can't hold; "
+            "use an .mp4, .mov or .mkv output"
+        )
+    
     # Validate input file
     if not os.path.exists(args.input_video):
         print(f"❌ Error: Input video file '{args.input_video}' not found.")
@@ -279,7 +876,9 @@ def main():
     generator = VideoCaptionGenerator(
         args.input_video, 
         args.output_video, 
-        args.model
+        args.model,
+        args.batch_size,
+        args.soft_subs
     )
     
     success = generator.generate_captioned_video()